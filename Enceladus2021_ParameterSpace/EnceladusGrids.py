@@ -115,8 +115,9 @@ def getsigmas(num, fixed={'T':None,'pH':None, 'CH4':None, 'CO2':None, 'H2':None,
       nomdict['T'] + errdict['T'],
       nomdict['pH'] + errdict['pH']])
 
-    # nb no gaussians, all flat
-    return [nominal + (upbounds - lowbounds)*(-0.5+np.random.rand(ndim)) for i in range(num)]
+    # nb no gaussians, all flat. Draw the whole (num, ndim) sample in one
+    # broadcast rather than building a list of per-sample arrays.
+    return nominal + (upbounds - lowbounds)*(-0.5+np.random.rand(num, ndim))
 
 
 
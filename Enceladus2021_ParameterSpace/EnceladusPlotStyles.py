@@ -18,19 +18,28 @@ from EnergyCalculations import getE_TOM
 # import EnceladusSampler_2 as ES2
 
 
-mpl.rcParams['contour.negative_linestyle'] = 'solid'
-mpl.rcParams['font.family'] = 'sans-serif'
-mpl.rcParams['font.sans-serif'] = 'cmr10'
-mpl.rcParams['font.serif'] = 'Times.tcc'
-mpl.rcParams['axes.linewidth'] = 2
-mpl.rcParams['mathtext.fontset'] = 'cm'
-mpl.rcParams['xtick.labelsize'] = 14
-mpl.rcParams['ytick.labelsize'] = 14
-mpl.rc('axes', unicode_minus=False)
-mpl.rcParams['hatch.linewidth'] = 2.0
+# rc settings shared by the Enceladus 2021 figures. These are applied by the
+# figure-making functions via set_plot_style (or an mpl.rc_context), rather
+# than by mutating the global rcParams whenever this module is imported.
 # print(mpl.rcParams.keys()) # to see what can be changed
-mpl.rcParams['font.size'] = 14
-# mpl.rcParams['font.weight'] = 'bold'
+ENC_RCPARAMS = {
+  'contour.negative_linestyle': 'solid',
+  'font.family': 'sans-serif',
+  'font.sans-serif': 'cmr10',
+  'font.serif': 'Times.tcc',
+  'axes.linewidth': 2,
+  'mathtext.fontset': 'cm',
+  'xtick.labelsize': 14,
+  'ytick.labelsize': 14,
+  'axes.unicode_minus': False,
+  'hatch.linewidth': 2.0,
+  'font.size': 14}
+  # 'font.weight': 'bold'
+
+def set_plot_style(extra={}):
+    """Apply the shared rc settings, optionally overriding some of them."""
+    mpl.rcParams.update(ENC_RCPARAMS)
+    mpl.rcParams.update(extra)
 
 
 
@@ -71,6 +80,30 @@ def add_pH_boxes(ax, CDAINMS=True, postberg=True):
         ax.fill_betweenx(Tfloats, gleinlists[0], gleinlists[1], color='none', edgecolor='g', hatch='.',linewidth=4, label='pH range to match CDA to INMS (using Waite 2017 composition)')
 
 
+# theory_estimates setup is expensive and identical between the maintenance
+# helpers below, which the multi-panel figures call once per panel. Build it
+# once and share it between calls.
+_TE_cache = None
+_TE_default_T = None
+
+def get_theory_estimates():
+    global _TE_cache, _TE_default_T
+    if _TE_cache is None:
+        # make a TOM and an Enceladus
+        _Enc = Enceladus('EncT')
+        TOM = getE_TOM(_Enc)
+        _TE_cache = es.applications.theory_estimates(TOM, _Enc)
+        _TE_default_T = _TE_cache.loc.env.T
+    else:
+        # temperature_defenses depends on the current state of the
+        # instance, and add_maintenance_lines leaves it at the top of its
+        # temperature sweep. Put it back in its freshly-built state so
+        # every caller starts from the same place.
+        _TE_cache.loc.change_T(_TE_default_T)
+        _TE_cache.org.get_ESynth(AA=True)
+    return _TE_cache
+
+
 def add_maintenance_lines(ax, colors=['tab:orange', 'k','y','c']):
     T1 = range(273, 375)
     PT = tem.MaintenanceRange_nATPs(Trange=T1, mCH4=3e-8, Tlst=False, fraction=False, Perform=False, dbpath='../../NutMEG-Implementations/TOM/allMtestc')
@@ -78,25 +111,21 @@ def add_maintenance_lines(ax, colors=['tab:orange', 'k','y','c']):
     ax.fill_between(T1, np.log10(PT[1]), np.log10(PT[2]), color=colors[0], alpha=0.6)
 
     T2 = range(273, 400)
-    # make a TOM and an Enceladus
-    _Enc = Enceladus('EncT')
-    TOM = getE_TOM(_Enc)
-
-    TE = es.applications.theory_estimates(TOM, _Enc)
-    Ti, L10, L2 = [],[],[]
-    for t in T2:
+    TE = get_theory_estimates()
+    # one row per defense, one column per temperature, so the fill_between
+    # bounds below are just row slices
+    defenses = np.empty((3, len(T2)))
+    for i, t in enumerate(T2):
         TE.loc.change_T(t)
         TE.org.get_ESynth(AA=True) # update the synthesis energy
         td = TE.temperature_defenses(t)
-        Ti.append(td['TijhuisAnaerobe'])
-        L10.append(td['Lever10pc'])
-        L2.append(td['Lever2pc'])
+        defenses[:,i] = td['TijhuisAnaerobe'], td['Lever10pc'], td['Lever2pc']
 
-    Ti = np.array(Ti)
+    Ti = defenses[0]
 
-    ax.fill_between(T2, np.log10(Ti-(0.32*Ti)), np.log10(Ti+(0.32*Ti)), color=colors[1], alpha=0.4, lw=3.)
+    ax.fill_between(T2, np.log10(0.68*Ti), np.log10(1.32*Ti), color=colors[1], alpha=0.4, lw=3.)
 
-    ax.fill_between(T2, np.log10(L10), np.log10(L2), color=colors[2], alpha=0.4)
+    ax.fill_between(T2, np.log10(defenses[1]), np.log10(defenses[2]), color=colors[2], alpha=0.4)
 
     ax.fill_between([T2[0],T2[-1]], [-18, -18], [-21, -21], color=colors[3], alpha=0.4)
     return ax
@@ -115,10 +144,7 @@ def add_pH_maintenance_lines(ax, T, pHrange=[7,12], colors=['tab:orange', 'k','g
     # pH is only 5--9 as that's as far as the data goes
     ax.fill_between([5,9], np.log10(PT[1]), np.log10(PT[2]), color=colors[0], alpha=0.4)
 
-    _Enc = Enceladus('EncT')
-    TOM = getE_TOM(_Enc)
-
-    TE = es.applications.theory_estimates(TOM, _Enc)
+    TE = get_theory_estimates()
     Ti, L10, L2 = [],[],[]
     td = TE.temperature_defenses(T)
     Ti.append(td['Tijhuis'])
@@ -133,7 +159,14 @@ def add_pH_maintenance_lines(ax, T, pHrange=[7,12], colors=['tab:orange', 'k','g
     return ax
 
 
+_energycmap_cache = None
+
 def energycolormap():
+    # built once and reused: MethanogenesisEnergyContourPlot asks for this
+    # on every call and the colormap never changes
+    global _energycmap_cache
+    if _energycmap_cache is not None:
+        return _energycmap_cache
     # top = plt.cm.get_cmap('winter_r', 128)
     cyan_to_b = {'red':[(0,0,0), (1,0,0)],
       'green':[(0,1,1),(1,0,0)],
@@ -153,6 +186,7 @@ def energycolormap():
                        middle(np.linspace(0, 1, 128)),
                        bottom(np.linspace(0, 1, 128))))
     newcmp = clr.ListedColormap(newcolors, name='energycol')
+    _energycmap_cache = newcmp
     return newcmp
 
 
@@ -173,17 +207,20 @@ def MethanogenesisEnergyContourPlot(ax, CO2origin='pH',
 
     levels = [-150, -75, 0, 75]
 
+    # convert the whole mesh from J to kJ once, not per contour set
+    ZZkJ = ZZ/1000
+
     # contf = ax.contourf(XX, YY, ZZ[maincont], levels=np.arange(-150000, 150000, 3000), cmap=energycolormap(), vmin=-150000, vmax=150000, extend='both')
-    contf = ax.contourf(XX, YY, ZZ[maincont]/1000, levels=np.arange(-160, 80, 2.5), cmap=energycolormap(), vmin=-160, vmax=80, extend='both')
+    contf = ax.contourf(XX, YY, ZZkJ[maincont], levels=np.arange(-160, 80, 2.5), cmap=energycolormap(), vmin=-160, vmax=80, extend='both')
 
 
     contourcolor='k'#'dimgray'
 
-    cont = ax.contour(XX, YY, ZZ[0]/1000, levels=levels, colors=[contourcolor], vmin=-150000, vmax=80000, linewidths=2.5)
+    cont = ax.contour(XX, YY, ZZkJ[0], levels=levels, colors=[contourcolor], vmin=-150000, vmax=80000, linewidths=2.5)
     ax.clabel(cont, inline=1, fontsize=16, fmt='%d') # add label
 
-    ax.contour(XX, YY, ZZ[1]/1000, levels=levels, linestyles='dotted', colors=[contourcolor], vmin=-150, vmax=80, linewidths=2.5)
-    ax.contour(XX, YY, ZZ[2]/1000, levels=levels, linestyles='dotted', colors=[contourcolor], vmin=-150, vmax=80, linewidths=2.5)
+    ax.contour(XX, YY, ZZkJ[1], levels=levels, linestyles='dotted', colors=[contourcolor], vmin=-150, vmax=80, linewidths=2.5)
+    ax.contour(XX, YY, ZZkJ[2], levels=levels, linestyles='dotted', colors=[contourcolor], vmin=-150, vmax=80, linewidths=2.5)
 
     ax.plot([0,0], [0,0], c= contourcolor, label='Uncertainty bounds on free energy contour', linestyle='dotted', linewidth=2.5)
 
@@ -192,6 +229,7 @@ def MethanogenesisEnergyContourPlot(ax, CO2origin='pH',
 
 def make_MGEContourPlot(CO2origin='pH', save='Energyplot.pdf', show=False, pHax=False, pHbars=False, quotienttype='salty_nominal'):
 
+    set_plot_style()
     fig, ax = plt.subplots(figsize=(8,8))
     ax, contf = MethanogenesisEnergyContourPlot(ax, CO2origin=CO2origin, pHrange=np.linspace(7,12, num=11), quotienttype=quotienttype)
 
@@ -226,6 +264,7 @@ def make_MGEContourPlot(CO2origin='pH', save='Energyplot.pdf', show=False, pHax=
 
 def MGEcomparison_plot():
 
+    set_plot_style()
     fig, ax = plt.subplots(nrows=1, ncols=2, figsize=(8,8))
     ax[0], contf = MethanogenesisEnergyContourPlot(ax[0],
       pHrange=np.linspace(7,12, num=11), CO2origin='pH')
@@ -262,6 +301,7 @@ def ATPEnergyContourPlot(ax, CO2origin='pH',
 
 def make_ATPContourPlot(CO2origin='pH', save='ConservableEnergyplot.pdf', show=False):
 
+    set_plot_style()
     fig, ax = plt.subplots(figsize=(8,8))
     ax, contf = ATPEnergyContourPlot(ax, CO2origin=CO2origin)
 
@@ -308,6 +348,7 @@ def PSContourPlot(ax, CO2origin='pH',
 
 def make_PSContourPlot(CO2origin='pH', save='Powersupply.pdf', show=False, mesh=False, Tline=True):
 
+    set_plot_style()
     fig, ax = plt.subplots(figsize=(8,8))
     ax, contf = PSContourPlot(ax, CO2origin=CO2origin, pHrange=np.linspace(7,12, num=11), mesh=mesh, cmap='BuPu')
 
@@ -338,6 +379,7 @@ def make_PSContourPlot(CO2origin='pH', save='Powersupply.pdf', show=False, mesh=
 
 def PScomparison_plot():
 
+    set_plot_style()
     fig, ax = plt.subplots(nrows=1, ncols=2, figsize=(8,8),)
     ax[0], contf = PSContourPlot(ax[0],
       pHrange=np.linspace(7,12, num=11), CO2origin='pH')
@@ -350,6 +392,7 @@ def PScomparison_plot():
 
 def PSunc_plot(CO2origin='HTHeating20', save='Powersupply_comp.pdf', show=False, mesh=False, Tline=True, nATP=1.0):
 
+        set_plot_style()
         fig, axs = plt.subplots(figsize=(10,6), nrows=1, ncols=2, constrained_layout=True)
 
         axs[0], contf = PSContourPlot(axs[0], CO2origin=CO2origin, pHrange=np.linspace(7,12, num=11), mesh=mesh, cmap='BuPu', maincont=1, k_corr=-1., nATP=nATP)
@@ -381,20 +424,13 @@ def PSunc_plot(CO2origin='HTHeating20', save='Powersupply_comp.pdf', show=False,
             plt.show()
 
 
-def PShabitabilityPlot(Trange = np.linspace(273,403, num=14), pHrange=np.linspace(7,12, num=11), nATP=1.0):
-
-    mpl.rcParams['xtick.labelsize'] = 13
-    mpl.rcParams['ytick.labelsize'] = 13
-    mpl.rcParams['font.size'] = 13
-
-    nomcols = plt.get_cmap('YlOrRd', 6)
-    cmaplist = [nomcols(i) for i in range(nomcols.N)]
-    # force the first color entry to be grey
-    cmaplist[0] = (.95, .95, .95, 1.0)
-
-    # create the new map
-    nomcols = mpl.colors.LinearSegmentedColormap.from_list(
-        'Custom cmap', cmaplist, nomcols.N)
+def PShabitabilitydata(Trange = np.linspace(273,403, num=14), pHrange=np.linspace(7,12, num=11), nATP=1.0):
+    """
+    Build the habitability classification grids for PShabitabilityPlot.
+    Returns the pH and T meshes plus one 0--5 classification grid per
+    maintenance power estimate. Kept separate from the plotting so the
+    grids can be recomputed or reused without touching matplotlib.
+    """
 
     # get a mesh for the 5 cases.
     fn_preamble=''
@@ -404,62 +440,77 @@ def PShabitabilityPlot(Trange = np.linspace(273,403, num=14), pHrange=np.linspac
         fn_preamble='E21data/PSgrids/'+str(nATP)+'_'
 
 
-    # for generating and saving
+    # load the power supply grids from disk if we have them, otherwise
+    # generate and save them so future calls skip the expensive meshes
+    try:
+        noms = np.load(fn_preamble+'noms.npy')
+        pHgrid = np.load(fn_preamble+'pHgrid.npy')
+        Tgrid = np.load(fn_preamble+'Tgrid.npy')
+        nomhigh = np.load(fn_preamble+'nomhigh.npy')
+        highest = np.load(fn_preamble+'highest.npy')
+        nomlow = np.load(fn_preamble+'nomlow.npy')
+        lowest = np.load(fn_preamble+'lowest.npy')
+    except:
+        nommesh = EnceladusGrids.getMesh(Trange, pHrange, params=['PowerSupply'], nATP=nATP, quotienttype='salty_endmember')
+        noms = nommesh['PowerSupply'][0]
+        pHgrid = nommesh['pH']
+        Tgrid = nommesh['T']
+
+        highmesh = EnceladusGrids.getMesh(Trange, pHrange, params=['PowerSupply'], nATP=nATP, k_corr=1., quotienttype='salty_high')['PowerSupply']
+        nomhigh = highmesh[0]
+        highest = highmesh[2]
+
+        lowmesh = EnceladusGrids.getMesh(Trange, pHrange, params=['PowerSupply'], nATP=nATP, k_corr=-1., quotienttype='salty_low')['PowerSupply']
+        nomlow = lowmesh[0]
+        lowest = lowmesh[1]
+
+        np.save(fn_preamble+'noms.npy', noms)
+        np.save(fn_preamble+'pHgrid.npy', pHgrid)
+        np.save(fn_preamble+'Tgrid.npy', Tgrid)
+        np.save(fn_preamble+'nomhigh.npy', nomhigh)
+        np.save(fn_preamble+'highest.npy', highest)
+        np.save(fn_preamble+'nomlow.npy', nomlow)
+        np.save(fn_preamble+'lowest.npy', lowest)
 
-    # noms = EnceladusGrids.getMesh(Trange, pHrange, params=['PowerSupply'], nATP=nATP, quotienttype='salty_endmember')
-    # np.save(fn_preamble+'noms.npy', noms['PowerSupply'][0])
-    # np.save(fn_preamble+'pHgrid.npy', noms['pH'])
-    # np.save(fn_preamble+'Tgrid.npy', noms['T'])
-    #
-    # nomhigh = EnceladusGrids.getMesh(Trange, pHrange, params=['PowerSupply'], nATP=nATP, k_corr=1., quotienttype='salty_high')['PowerSupply'][0]
-    # highest = EnceladusGrids.getMesh(Trange, pHrange, params=['PowerSupply'], nATP=nATP, k_corr=1., quotienttype='salty_high')['PowerSupply'][2]
-    #
-    # nomlow = EnceladusGrids.getMesh(Trange, pHrange, params=['PowerSupply'], nATP=nATP, k_corr=-1., quotienttype='salty_low')['PowerSupply'][0]
-    # lowest = EnceladusGrids.getMesh(Trange, pHrange, params=['PowerSupply'], nATP=nATP, k_corr=-1., quotienttype='salty_low')['PowerSupply'][1]
-    #
-    # np.save(fn_preamble+'nomhigh.npy', nomhigh)
-    # np.save(fn_preamble+'highest.npy', highest)
-    # np.save(fn_preamble+'nomlow.npy', nomlow)
-    # np.save(fn_preamble+'lowest.npy', lowest)
 
+    # get the maintenance dictionaries
+    HC, Ti, L, B = EnceladusGrids.maintenancemesh(Trange, pHrange, nATP=nATP)
 
-    noms = np.load(fn_preamble+'noms.npy')
-    pHgrid = np.load(fn_preamble+'pHgrid.npy')
-    Tgrid = np.load(fn_preamble+'Tgrid.npy')
-    nomhigh = np.load(fn_preamble+'nomhigh.npy')
-    highest = np.load(fn_preamble+'highest.npy')
-    nomlow = np.load(fn_preamble+'nomlow.npy')
-    lowest = np.load(fn_preamble+'lowest.npy')
+    # classify each grid point in one vectorised pass per maintenance power
+    # rather than an elif chain per (T, pH) point. np.select takes the first
+    # condition which holds, mirroring the old elif ordering. The classes
+    # are just the six categories 0--5 so float32 carries them exactly at
+    # half the width; the power supply grids themselves must stay float64
+    # as their values reach ~1e-50, below the float32 underflow limit.
+    def habclass(mp):
+        return np.select(
+          [lowest > mp, nomlow > mp, noms > mp, nomhigh > mp, highest > mp],
+          [1, 2, 3, 4, 5], default=0).astype(np.float32)
 
+    HCpass = habclass(HC)
+    Tipass = habclass(Ti)
+    Lpass = habclass(L)
+    Bpass = habclass(B)
 
-    # get the maintenance dictionaries
-    HC, Ti, L, B = EnceladusGrids.maintenancemesh(Trange, pHrange, nATP=nATP)
+    return pHgrid, Tgrid, HCpass, Tipass, Lpass, Bpass
+
+
+def PShabitabilityPlot(Trange = np.linspace(273,403, num=14), pHrange=np.linspace(7,12, num=11), nATP=1.0):
+
+    set_plot_style(extra={'xtick.labelsize': 13, 'ytick.labelsize': 13,
+      'font.size': 13})
+
+    nomcols = plt.get_cmap('YlOrRd', 6)
+    cmaplist = [nomcols(i) for i in range(nomcols.N)]
+    # force the first color entry to be grey
+    cmaplist[0] = (.95, .95, .95, 1.0)
+
+    # create the new map
+    nomcols = mpl.colors.LinearSegmentedColormap.from_list(
+        'Custom cmap', cmaplist, nomcols.N)
 
-    Bpass = np.ndarray((len(Trange), len(pHrange)))
-    Lpass = np.ndarray((len(Trange), len(pHrange)))
-    Tipass = np.ndarray((len(Trange), len(pHrange)))
-    HCpass = np.ndarray((len(Trange), len(pHrange)))
-    # print(HCpass)
-
-    yindex = 0
-    for T in Trange:
-        xindex = 0
-        for pH in pHrange:
-            for mp, mppass in zip([HC,Ti,L,B], [HCpass, Tipass, Lpass, Bpass]):
-                mppass[yindex][xindex] = 0
-                if lowest[yindex][xindex] > mp[yindex][xindex]:
-                    mppass[yindex][xindex] = 1
-                elif nomlow[yindex][xindex] > mp[yindex][xindex]:
-                    mppass[yindex][xindex] = 2
-                elif noms[yindex][xindex] > mp[yindex][xindex]:
-                    mppass[yindex][xindex] = 3
-                elif nomhigh[yindex][xindex] > mp[yindex][xindex]:
-                    mppass[yindex][xindex] = 4
-                elif highest[yindex][xindex] > mp[yindex][xindex]:
-                    mppass[yindex][xindex] = 5
-
-            xindex += 1
-        yindex += 1
+    pHgrid, Tgrid, HCpass, Tipass, Lpass, Bpass = PShabitabilitydata(
+      Trange=Trange, pHrange=pHrange, nATP=nATP)
 
     fig, ax = plt.subplots(nrows=2, ncols=2, figsize=(10,11))
     contf = ax[0][0].pcolormesh(pHgrid, Tgrid, HCpass, vmin=0, vmax=5, shading='nearest', cmap=nomcols, edgecolor='slategray', linewidth=1)
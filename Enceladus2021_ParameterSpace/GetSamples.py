@@ -42,6 +42,7 @@ for s in salt:
 
 def varianceexample(samplesize):
     """ Plot overall variance at select pH and salt levels """
+    SPS.set_plot_style()
     fig, ax = plt.subplots(nrows=3, ncols=3, figsize=(9,9))
     ax[0][0], hb, hr = SPS.all_varianceplot_T(ax[0][0], samplesize, 8, salttype='high')
     ax[0][1], hb, hr = SPS.all_varianceplot_T(ax[0][1], samplesize, 9, salttype='high')
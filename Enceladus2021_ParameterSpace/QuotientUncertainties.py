@@ -4,6 +4,21 @@ from NutMEG.reactor.saved_systems.Enceladus import Enceladus as Enc
 import numpy as np
 from uncertainties import ufloat as uf
 
+def param_bounds(nom, do, up):
+    """
+    Package nominal, lower-bound and upper-bound (quotient, gibbs, ATPgibbs,
+    PowerSupply, max_k) tuples from MGparams in the form the meshes expect.
+    """
+    Q, G, GP, PS, mk = nom
+    Q_do, G_do, GP_do, PS_do, mk_do = do
+    Q_up, G_up, GP_up, PS_up, mk_up = up
+    return {'Gibbs_Methanogenesis' : np.array([[G, G_do, G_up]]),
+      'Quotient' : np.array([[Q, Q_do, Q_up]]),
+      'PowerSupply' : np.array([[PS, PS_do, PS_up]]),
+      'ATPGibbs': np.array([[GP, GP_do, GP_up]]),
+      'max_k' : np.array([[mk, mk_do, mk_up]])}
+
+
 def Q_allunc(E, nATP, k_corr):
     """
     Get growth parameters for a methanogenesis quotient in which all the
@@ -19,7 +34,7 @@ def Q_allunc(E, nATP, k_corr):
     QE.composition['Methane(aq)'].activity = E.composition['Methane(aq)'].activity.n
     QE.composition['H2O(l)'].activity = E.composition['H2O(l)'].activity.n
     #quotient, gibbs, ATPgibbs, PowerSupply, max_k
-    Q, G, GP, PS, mk = MGparams(QE, k_corr=k_corr, nATP=nATP)
+    nom = MGparams(QE, k_corr=k_corr, nATP=nATP)
 
 
     ######### min products, max reactants  #########
@@ -32,7 +47,7 @@ def Q_allunc(E, nATP, k_corr):
     QE.composition['H2O(l)'].activity = (
       E.composition['H2O(l)'].activity.n - E.composition['H2O(l)'].activity.s)
 
-    Q_up, G_up, GP_up, PS_up, mk_up = MGparams(QE, k_corr=k_corr, nATP=nATP)
+    up = MGparams(QE, k_corr=k_corr, nATP=nATP)
 
     ######### max products, min reactants  #########
     QE.composition['CO2(aq)'].activity = (
@@ -44,13 +59,9 @@ def Q_allunc(E, nATP, k_corr):
     QE.composition['H2O(l)'].activity = (
       E.composition['H2O(l)'].activity.n + E.composition['H2O(l)'].activity.s)
 
-    Q_do, G_do, GP_do, PS_do, mk_do = MGparams(QE, k_corr=k_corr, nATP=nATP)
+    do = MGparams(QE, k_corr=k_corr, nATP=nATP)
 
-    return {'Gibbs_Methanogenesis' : np.array([[G, G_do, G_up]]),
-      'Quotient' : np.array([[Q, Q_do, Q_up]]),
-      'PowerSupply' : np.array([[PS, PS_do, PS_up]]),
-      'ATPGibbs': np.array([[GP, GP_do, GP_up]]),
-      'max_k' : np.array([[mk, mk_do, mk_up]])}
+    return param_bounds(nom, do, up)
 
 
 
@@ -76,7 +87,7 @@ def Q_salty_endmember(E, nATP, k_corr):
     QE.composition['Methane(aq)'].activity = E.calc_mol_CH4(CO2salt273[0]).n
     QE.composition['H2O(l)'].activity = H2Osalt[0]
     # quotient, gibbs, ATPgibbs, PowerSupply, max_k
-    Q, G, GP, PS, mk = MGparams(QE, k_corr=k_corr, nATP=nATP)
+    nom = MGparams(QE, k_corr=k_corr, nATP=nATP)
 
     ######### min products, max reactants  #########
     QE.composition['CO2(aq)'].activity = (CO2salt[1])
@@ -86,7 +97,7 @@ def Q_salty_endmember(E, nATP, k_corr):
     QE.composition['Methane(aq)'].activity = (CH4.n - CH4.s)
     QE.composition['H2O(l)'].activity = (H2Osalt[1])
 
-    Q_up, G_up, GP_up, PS_up, mk_up = MGparams(QE, k_corr=k_corr, nATP=nATP)
+    up = MGparams(QE, k_corr=k_corr, nATP=nATP)
 
     ######### max products, min reactants  #########
     QE.composition['CO2(aq)'].activity = (CO2salt[2])
@@ -96,13 +107,9 @@ def Q_salty_endmember(E, nATP, k_corr):
     QE.composition['Methane(aq)'].activity = (CH4.n + CH4.s)
     QE.composition['H2O(l)'].activity = (H2Osalt[2])
 
-    Q_do, G_do, GP_do, PS_do, mk_do = MGparams(QE, k_corr=k_corr, nATP=nATP)
+    do = MGparams(QE, k_corr=k_corr, nATP=nATP)
 
-    return {'Gibbs_Methanogenesis' : np.array([[G, G_do, G_up]]),
-      'Quotient' : np.array([[Q, Q_do, Q_up]]),
-      'PowerSupply' : np.array([[PS, PS_do, PS_up]]),
-      'ATPGibbs': np.array([[GP, GP_do, GP_up]]),
-      'max_k' : np.array([[mk, mk_do, mk_up]])}
+    return param_bounds(nom, do, up)
 
 
 def get_salty_Enc(E, salttype, CO2unc=0.0, H2Ounc=0.0):
@@ -146,40 +153,50 @@ def Q_salty(E, nATP, k_corr, salttype, CO2unc=0.0, H2Ounc=0.0):
     salttype = {'nom', 'high', 'low'}
     """
 
-    _QE = get_salty_Enc(E, salttype, CO2unc=CO2unc, H2Ounc=H2Ounc)
-    QE = deepcopy(_QE)
-    aCO2 = _QE.composition['CO2(aq)'].activity
-    aH2O = _QE.composition['H2O(l)'].activity
-    aH2 = _QE.composition['H2(aq)'].activity
-    aCH4 = _QE.composition['Methane(aq)'].activity
+    QE = deepcopy(E)
+
+    CO2salt, H2Osalt = Enc.get_CO2_from_HTHeating(QE.env.T, QE.ocean_pH, salts=True)
+    CO2salt273, H2Osalt273 = Enc.get_CO2_from_HTHeating(273.15, QE.ocean_pH, salts=True)
+
+    if salttype == 'nom':
+        si = 0
+    elif salttype =='high':
+        si = 1
+    elif salttype == 'low':
+        si = 2
+    else:
+        raise ValueError('Unknown salt type sent to Q_salty')
+
+    # keep the endmember activities as plain (nominal, std) floats rather
+    # than wrapping them in ufloats only to unpack them again below
+    aCO2n, aCO2s = CO2salt[si], CO2salt[si]*CO2unc
+    aH2On, aH2Os = H2Osalt[si], H2Osalt[si]*H2Ounc
+    aH2 = QE.calc_mol_H2(CO2salt273[si])
+    aCH4 = QE.calc_mol_CH4(CO2salt273[si])
 
     ######### Nominal parameters ##########
 
-    QE.composition['CO2(aq)'].activity = aCO2.n
+    QE.composition['CO2(aq)'].activity = aCO2n
     QE.composition['H2(aq)'].activity = aH2.n
     QE.composition['Methane(aq)'].activity = aCH4.n
-    QE.composition['H2O(l)'].activity = aH2O.n
+    QE.composition['H2O(l)'].activity = aH2On
     # quotient, gibbs, ATPgibbs, PowerSupply, max_k
-    Q, G, GP, PS, mk = MGparams(QE, k_corr=k_corr, nATP=nATP)
+    nom = MGparams(QE, k_corr=k_corr, nATP=nATP)
 
     ######### min products, max reactants  #########
-    QE.composition['CO2(aq)'].activity = aCO2.n+aCO2.s
+    QE.composition['CO2(aq)'].activity = aCO2n+aCO2s
     QE.composition['H2(aq)'].activity = (aH2.n + aH2.s)
     QE.composition['Methane(aq)'].activity = (aCH4.n - aCH4.s)
-    QE.composition['H2O(l)'].activity = aH2O.n-aH2O.s
+    QE.composition['H2O(l)'].activity = aH2On-aH2Os
 
-    Q_up, G_up, GP_up, PS_up, mk_up = MGparams(QE, k_corr=k_corr, nATP=nATP)
+    up = MGparams(QE, k_corr=k_corr, nATP=nATP)
 
     ######### max products, min reactants  #########
-    QE.composition['CO2(aq)'].activity = aCO2.n-aCO2.s
+    QE.composition['CO2(aq)'].activity = aCO2n-aCO2s
     QE.composition['H2(aq)'].activity = (aH2.n - aH2.s)
     QE.composition['Methane(aq)'].activity = (aCH4.n + aCH4.s)
-    QE.composition['H2O(l)'].activity = aH2O.n+aH2O.s
+    QE.composition['H2O(l)'].activity = aH2On+aH2Os
 
-    Q_do, G_do, GP_do, PS_do, mk_do = MGparams(QE, k_corr=k_corr, nATP=nATP)
+    do = MGparams(QE, k_corr=k_corr, nATP=nATP)
 
-    return {'Gibbs_Methanogenesis' : np.array([[G, G_do, G_up]]),
-      'Quotient' : np.array([[Q, Q_do, Q_up]]),
-      'PowerSupply' : np.array([[PS, PS_do, PS_up]]),
-      'ATPGibbs': np.array([[GP, GP_do, GP_up]]),
-      'max_k' : np.array([[mk, mk_do, mk_up]])}
+    return param_bounds(nom, do, up)
@@ -26,16 +26,9 @@ def plot_sigmas(sample):
     """
     sig = EG.getsigmas(sample, fixed={'T':330, 'pH':8.5}, dummyvals=True)
 
-    a, b, c, d, e, f = [],[],[],[], [],[]
-
-    for i in sig:
-        a.append(i[0])
-        b.append(i[1])
-        c.append(i[2])
-        d.append(i[3])
-        e.append(i[4])
-        f.append(i[5])
-
+    # getsigmas returns a (num, ndim) array, so slice out the columns
+    # instead of unpacking sample-by-sample
+    a, b, c, d, e, f = sig[:,0], sig[:,1], sig[:,2], sig[:,3], sig[:,4], sig[:,5]
 
     fig, axs = plt.subplots(nrows=3, ncols=2)
 
@@ -417,17 +410,16 @@ def kdecontour(ax, x, y, s=10, cmap='Blues'):
     y = y[zeroes]
     x = x[zeroes]
 
-    xgrid = np.linspace(min(x)*0.9, max(x)*1.1, num=250)
-    ygrid = np.linspace(-45, -5, num=250)
+    xgrid = np.linspace(x.min()*0.9, x.max()*1.1, num=250)
+    # follow the sample in log-power space rather than always spanning
+    # -45 to -5: resolving empty decades just wastes kde evaluations
+    ygrid = np.linspace(y.min()-1., y.max()+1., num=250)
 
     xx, yy = np.meshgrid(xgrid, ygrid)
-    # xy = np.vstack([x, y])
-    z = np.ndarray((len(xgrid),len(ygrid)))
-
+    # evaluate the kde over the whole grid in one call rather than
+    # point-by-point, then reshape back to the mesh
     _kde = kde([x,y])
-    for i,xi in enumerate(xgrid):
-        for j, yi in enumerate(ygrid):
-            z[j][i] = _kde.evaluate([xi, yi])
+    z = _kde(np.vstack([xx.ravel(), yy.ravel()])).reshape(xx.shape)
     # print(math.log10(z.max()))
     ax.contourf(xx, yy, z, cmap=cmap, levels=np.logspace(-6,math.log10(z.max())))
     return ax
@@ -16,21 +16,19 @@ but may come in handy for future work.
 """
 
 
-# can remove this if you import enceladusplotstyles
-mpl.rcParams['contour.negative_linestyle'] = 'solid'
-mpl.rcParams['font.family'] = 'sans-serif'
-mpl.rcParams['font.sans-serif'] = 'cmr10'
-mpl.rcParams['font.serif'] = 'Times.tcc'
-mpl.rcParams['axes.linewidth'] = 3
-mpl.rcParams['lines.linewidth'] = 3
-mpl.rcParams['mathtext.fontset'] = 'cm'
-mpl.rcParams['xtick.labelsize'] = 12
-mpl.rcParams['ytick.labelsize'] = 12
-mpl.rc('axes', unicode_minus=False)
-mpl.rcParams['hatch.linewidth'] = 2.0
-# print(mpl.rcParams.keys()) # to see what can be changed
-mpl.rcParams['font.size'] = 12
-# mpl.rcParams['font.weight'] = 'bold'
+# the sampling figures share the EnceladusPlotStyles rc settings with heavier
+# lines and slightly smaller text. Applied by the figure-making functions via
+# set_plot_style rather than at import time.
+SPS_RCPARAMS = dict(EPS.ENC_RCPARAMS,
+  **{'axes.linewidth': 3,
+     'lines.linewidth': 3,
+     'xtick.labelsize': 12,
+     'ytick.labelsize': 12,
+     'font.size': 12})
+
+def set_plot_style():
+    """Apply the shared rc settings for the sampling figures."""
+    mpl.rcParams.update(SPS_RCPARAMS)
 
 
 def nominalline_T(ax, pH, c, Trange=[273,400], salttype='nom', zeroed=True, ls='-',
@@ -111,13 +109,10 @@ def all_varianceplot_pH(ax, samplesize, T, salttype='nom', pHrange=[8,12], fixup
     zeroes = (_logy != -50.)
     logy = _logy[zeroes]
     x = xvals[zeroes]
-    logvariance = np.empty(len(logy))
 
-    ic = 0
-    for xi, logyi in zip(x, logy):
-        close_nom = int((xi-pHrange[0]) / (pHrange[1]-pHrange[0]) * len(nx))
-        logvariance[ic] = logyi - nPS[close_nom]
-        ic+=1
+    # find the nearest nominal for each sample in one vectorised pass
+    close_nom = ((x-pHrange[0]) / (pHrange[1]-pHrange[0]) * len(nx)).astype(int)
+    logvariance = logy - nPS[close_nom]
     ax.hist2d(x,logvariance, bins=[45,45], range=[pHrange, [-4, 4]], cmap=cm, edgecolor=None)
 
     return ax
@@ -141,18 +136,13 @@ def all_varianceplot_T(ax, samplesize, pH, salttype='nom', Trange=[273,400], fix
     zeroes = (_logy != -50.)
     logy = _logy[zeroes]
     x = xvals[zeroes]
-    logvariance = np.empty(len(logy))
-    xreds = []
-    vreds = []
-
-    ic = 0
-    for xi, logyi in zip(x, logy):
-        close_nom = int((xi-Trange[0]) / (Trange[1]-Trange[0]) * len(nx))
-        logvariance[ic] = logyi - nPS[close_nom]
-        if logvariance[ic] > 10:
-            vreds.append(0)
-            xreds.append(x[ic])
-        ic+=1
+
+    # find the nearest nominal for each sample in one vectorised pass
+    close_nom = ((x-Trange[0]) / (Trange[1]-Trange[0]) * len(nx)).astype(int)
+    logvariance = logy - nPS[close_nom]
+    reds = logvariance > 10
+    xreds = x[reds]
+    vreds = np.zeros(len(xreds))
     hb = ax.hist2d(x,logvariance, bins=[45,45], range=[Trange, [-4, 4]], cmap='Blues', edgecolor=None, vmin=0, vmax=samplesize/200)
     hr = ax.hist2d(xreds, vreds, bins=[45,45], range=[Trange, [-4, 4]], cmap=cmapper.r2a(), edgecolor=None, vmin=0, vmax=samplesize/100)
     return ax, hb, hr
@@ -169,10 +159,15 @@ def nominal2x3(Ts=[275, 300, 325], pHs=[8,9,10], save='figs/nominal2x3.pdf', sho
     This also plots some characteristic maintenance powers
     """
 
+    set_plot_style()
     fig, ax = plt.subplots(figsize=(9,12), ncols=2, nrows=3)
 
-    nomcols = [mpl.cm.get_cmap('autumn')(i*0.15) for i in range(0,5)]
-    maincols = [mpl.cm.get_cmap('winter')(i*0.33) for i in range(0,4)]
+    # look the colormaps up once and sample them, rather than refetching
+    # them for every colour
+    autumn = mpl.cm.get_cmap('autumn')
+    winter = mpl.cm.get_cmap('winter')
+    nomcols = [autumn(i*0.15) for i in range(0,5)]
+    maincols = [winter(i*0.33) for i in range(0,4)]
 
     for i, T in enumerate(Ts):
 
@@ -237,6 +232,7 @@ def nominal2x3(Ts=[275, 300, 325], pHs=[8,9,10], save='figs/nominal2x3.pdf', sho
 
 def binsexample():
     """ Example of plotting histograms over nominal power supply lines """
+    set_plot_style()
     fig, ax = plt.subplots(figsize=(10,5), ncols=2, nrows=1)
 
     # ax[0] = samplebins_T(ax[0], 8, 1000, cmapper.k2a())
@@ -266,7 +262,8 @@ def ones_varianceplot(T=300, pH=None, salttype='nom', samplesize=100,
     space: nATP, aCH4, aH2 and k.
     """
 
-    fig, ax = plt.subplots(figsize=(8,8), ncols=2, nrows=2)
+    set_plot_style()
+    fig, ax = plt.subplots(figsize=(8,8), ncols=2, nrows=2, constrained_layout=True)
     ax = ax.flatten()
 
     minx,maxx = 0, 0
@@ -298,18 +295,13 @@ def ones_varianceplot(T=300, pH=None, salttype='nom', samplesize=100,
             zeroes = (_logy != -50.)
             logy = _logy[zeroes]
             x = xvals[zeroes]
-            logvariance = np.empty(len(logy))
-            xreds = []
-
-            ic = 0
-            for xi, logyi in zip(x, logy):
-                close_nom = int(((xi-minx) / (maxx-minx)) * len(nx))
-                logvariance[ic] = logyi - nPS[close_nom]
-                if logvariance[ic] > 10:
-                    xreds.append(x[ic])
-                ic+=1
+
+            # find the nearest nominal for each sample in one vectorised pass
+            close_nom = (((x-minx) / (maxx-minx)) * len(nx)).astype(int)
+            logvariance = logy - nPS[close_nom]
+            xreds = x[logvariance > 10]
             ax[i].hist2d(x,logvariance, bins=[45,45], range=[[minx, maxx], [-4, 4]], cmap=cm, edgecolor=None, vmax=samplesize/100)
-            ax[i].hist2d(xreds,[0]*len(xreds), bins=[45,45], range=[[minx, maxx], [-4, 4]], cmap=cmapper.r2a(), edgecolor=None, vmax=samplesize/100)
+            ax[i].hist2d(xreds,np.zeros(len(xreds)), bins=[45,45], range=[[minx, maxx], [-4, 4]], cmap=cmapper.r2a(), edgecolor=None, vmax=samplesize/100)
 
             # ax[i].scatter(x,logvariance, alpha=0.1, c='b', edgecolor=None)
             # ax[i].set_xlim([minx, maxx])
@@ -322,7 +314,6 @@ def ones_varianceplot(T=300, pH=None, salttype='nom', samplesize=100,
         plt.suptitle('Variance with pH when T = '+str(T)+', '+salttype+' salt')
     elif T == None:
         plt.suptitle('Variance with T when pH = '+str(pH)+', '+salttype+' salt')
-    plt.tight_layout()
     if save:
         plt.savefig('figs/_indy_samples/'+str(samplesize)+'_T_'+str(T)+'_pH_'+str(pH)+'_salt_'+salttype+'.pdf')
     if show:
@@ -338,7 +329,8 @@ def ones_varianceplot(T=300, pH=None, salttype='nom', samplesize=100,
 ###### may not be needed
 def varianceexample():
     """ Plot overall variance at select pH and salt levels """
-    fig, ax = plt.subplots(nrows=3, ncols=3, figsize=(9,9))
+    set_plot_style()
+    fig, ax = plt.subplots(nrows=3, ncols=3, figsize=(9,9), constrained_layout=True)
     ax[0][0] = all_varianceplot_T(ax[0][0], 100, 8, salttype='high')
     ax[0][1] = all_varianceplot_T(ax[0][1], 100, 9, salttype='high')
     ax[0][1] = all_varianceplot_T(ax[0][2], 100, 10, salttype='high')
@@ -353,7 +345,6 @@ def varianceexample():
 
     # ax[1][0] = all_varianceplot_pH(ax[1][0], 100, 300)
     # ax[1][1] = all_varianceplot_pH(ax[1][1], 100, 300, salttype='high')
-    plt.tight_layout()
     plt.savefig('allvtest.pdf')
     plt.show()
 
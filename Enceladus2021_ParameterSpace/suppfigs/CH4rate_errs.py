@@ -49,6 +49,9 @@ for index, row in df.iterrows():
 # CH4pol = np.polyfit(Ts, np.log(CH4s), 1)
 # GRspol = np.polyfit(Ts, np.log(GRs), 1)
 
+# back to kPa once, for colouring the scatter plots below
+Pressures_kPa = np.array(Pressures)*0.001
+
 def concupdate(R):
     """Change the concentrations of H2 and CO2 in reactor R to replicate TOM conditions at the reactor's temperature and pressure."""
     R.composition['H2(aq)'].activity = VenusDrop.getgasconc('H2(aq)', 0.8*R.env.P,
@@ -148,19 +151,20 @@ plt.savefig('kT_oldCH4_newTOMPress.pdf')
 
 CH4poly = np.polyfit(empTs, np.log(CH4s), 1)
 CH4lin = np.exp((CH4poly[0]*Ts) + CH4poly[1])
-CH4_p1 = 10**(np.log10(CH4lin)+1)
-CH4_m1 = 10**(np.log10(CH4lin)-1)
+# one order of magnitude either side, without the log/exp round trip
+CH4_p1 = CH4lin*10.
+CH4_m1 = CH4lin*0.1
 
 
 fig, axs = plt.subplots(nrows=1, figsize=(7,5))
-cm = axs.scatter(empTs, CH4s, c=np.array([Pressures])*0.001)
+cm = axs.scatter(empTs, CH4s, c=Pressures_kPa)
 axs.plot(Ts, CH4lin, lw=3, c='k', label='nominal k')
 axs.plot(Ts, CH4_p1, lw=3, c='k', linestyle='dashed', label='bounds of k')
 axs.plot(Ts, CH4_m1, lw=3, c='k', linestyle='dashed')
 axs.legend(fontsize=14)
 
 
-# cm = axs[1].scatter(empTs, GRs, c=np.array([Pressures])*0.001)
+# cm = axs[1].scatter(empTs, GRs, c=Pressures_kPa)
 # axs[1].plot(Ts, GRlin, lw=3, c='k')
 
 axs.grid(b=True, which='major', color='#666666', linestyle='-', alpha=0.8)
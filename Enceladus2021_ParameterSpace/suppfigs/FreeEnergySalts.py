@@ -12,9 +12,8 @@ import EnceladusPlotStyles as EPS
 
 ##### Needs titles, labels, ticks on colorbar, legend? sorted
 
-mpl.rcParams['xtick.labelsize'] = 13
-mpl.rcParams['ytick.labelsize'] = 13
-mpl.rcParams['font.size'] = 13
+EPS.set_plot_style(extra={'xtick.labelsize': 13, 'ytick.labelsize': 13,
+  'font.size': 13})
 
 fig, axs = plt.subplots(nrows=2, ncols=2, figsize=(10,10))
 
@@ -457,10 +457,6 @@ def doubleanim():
         baraxs[2].set_xlim(1e3,1e12)
         baraxs[3].set_xlim(2e-8,1e-3)
 
-
-        plt.tight_layout()
-        fig.subplots_adjust(wspace=0)
-
         return fig
 
     T=250
@@ -472,6 +468,14 @@ def doubleanim():
 
     frames=range(51)
 
+    # lay the figure out once from the first frame. Redoing tight_layout and
+    # the wspace adjustment inside the callback redid the whole layout
+    # calculation on every frame (and fought the constrained layout above).
+    doublean(0)
+    fig.set_constrained_layout(False)
+    plt.tight_layout()
+    fig.subplots_adjust(wspace=0)
+
     ani = animation.FuncAnimation(fig, doublean, frames=len(frames), interval=interval)
     ani.save('GCan.gif', writer='imagemagick')
 
@@ -104,12 +104,15 @@ def avgCH4_GR():
     CH4pol = np.polyfit(Ts, np.log(CH4s), 1)
     GRspol = np.polyfit(Ts, np.log(GRs), 1)
 
+    # only scan the temperature list once for its extrema
+    Tmin, Tmax = min(Ts), max(Ts)
+
     fig, axs = plt.subplots(nrows=2, figsize=(7,7))
     axs[0].scatter(Ts, CH4s, label='Empirical methanogens', marker='x')
-    axs[0].plot([min(Ts), max(Ts)], np.exp([CH4pol[0]*(min(Ts))+CH4pol[1], CH4pol[0]*(max(Ts))+CH4pol[1]]), c='k', label='Typical optimal methanogen', linewidth=3)
+    axs[0].plot([Tmin, Tmax], np.exp([CH4pol[0]*Tmin+CH4pol[1], CH4pol[0]*Tmax+CH4pol[1]]), c='k', label='Typical optimal methanogen', linewidth=3)
 
     axs[1].scatter(Ts, GRs, label='Empirical methanogens', marker='x')
-    axs[1].plot([min(Ts), max(Ts)], np.exp([GRspol[0]*(min(Ts))+GRspol[1], GRspol[0]*(max(Ts))+GRspol[1]]), c='k',  label='Typical optimal methanogen', linewidth=3)
+    axs[1].plot([Tmin, Tmax], np.exp([GRspol[0]*Tmin+GRspol[1], GRspol[0]*Tmax+GRspol[1]]), c='k',  label='Typical optimal methanogen', linewidth=3)
 
     axs[0].set_yscale('log')
     axs[1].set_yscale('log')
@@ -6,6 +6,7 @@ import NutMEG.util.NutMEGparams as nmp
 
 import matplotlib.pyplot as plt
 import matplotlib as mpl
+import numpy as np
 # change matplotlib rcparams updating plot fonts etc.
 mpl.rcParams['font.family'] = 'sans-serif'
 mpl.rcParams['font.sans-serif'] = 'cmr10'
@@ -17,11 +18,10 @@ mpl.rc('axes', unicode_minus=False)
 
 def tovol(vol, lsts):
     """Convert lists passed into unit volume"""
+    vol = np.asarray(vol, dtype=float)
     for l in lsts:
-        i=0
-        for n, v in zip(l,vol):
-            l[i] = n/v
-            i +=1
+        # divide elementwise in one numpy pass, updating the list in place
+        l[:] = np.asarray(l, dtype=float)/vol
 
 def plot_powers(ax, key, ilabel, files=('data/EmpiricalMethanogens/CH483.csv',), unitBM=False, theory=True, log=True, lowhigh=[], dbpath=nmp.std_dbpath):
     """Plot the maintenance power of the individual methanogens in the database """
@@ -216,14 +216,14 @@ def Venus_overall_methanogenesis():
     SR = es.base_organism('methanogen', V,
       setup_methanogenesis(V), workoutID=False)
 
-    # set up lists for plotting
-    minG=[]
-    midG=[]
-    maxG=[]
-
     Tlst=np.linspace(278,350, num=100)
 
-    for T in Tlst:
+    # preallocate the output arrays rather than growing lists in the loop
+    minG=np.empty(len(Tlst))
+    midG=np.empty(len(Tlst))
+    maxG=np.empty(len(Tlst))
+
+    for i, T in enumerate(Tlst):
          ### 25C
         V.env.T = T
 
@@ -237,7 +237,7 @@ def Venus_overall_methanogenesis():
         # the current environment.
         SR.respiration.net_pathway.update_molar_gibbs_from_quotient()
 
-        minG.append(SR.respiration.net_pathway.molar_gibbs)
+        minG[i] = SR.respiration.net_pathway.molar_gibbs
 
         #for midG, use recorded values
         V.update_reagent('H2(aq)', 25)
@@ -249,7 +249,7 @@ def Venus_overall_methanogenesis():
         # the current environment.
         SR.respiration.net_pathway.update_molar_gibbs_from_quotient()
 
-        midG.append(SR.respiration.net_pathway.molar_gibbs)
+        midG[i] = SR.respiration.net_pathway.molar_gibbs
 
         #for maxG, maximise products, minimise reactants
         V.update_reagent('H2(aq)', 15)
@@ -261,7 +261,7 @@ def Venus_overall_methanogenesis():
         # the current environment.
         SR.respiration.net_pathway.update_molar_gibbs_from_quotient()
 
-        maxG.append(SR.respiration.net_pathway.molar_gibbs)
+        maxG[i] = SR.respiration.net_pathway.molar_gibbs
 
     return Tlst, minG, midG, maxG
 
@@ -274,14 +274,14 @@ def Venus_overall_sulfatereduction():
     SR = es.base_organism('SulfateReducer', V,
       setup_sulfatereduction(V), workoutID=False)
 
-    # set up lists for plotting
-    minG=[]
-    midG=[]
-    maxG=[]
-
     Tlst=np.linspace(278,350, num=100)
 
-    for T in Tlst:
+    # preallocate the output arrays rather than growing lists in the loop
+    minG=np.empty(len(Tlst))
+    midG=np.empty(len(Tlst))
+    maxG=np.empty(len(Tlst))
+
+    for i, T in enumerate(Tlst):
          ### 25C
         V.env.T = T
         update_all_comp_ppm(V)
@@ -294,7 +294,7 @@ def Venus_overall_sulfatereduction():
         # the current environment.
         SR.respiration.net_pathway.update_molar_gibbs_from_quotient()
 
-        minG.append(SR.respiration.net_pathway.molar_gibbs)
+        minG[i] = SR.respiration.net_pathway.molar_gibbs
 
         #for midG, use recorded values
         V.update_reagent('H2(aq)', 25)
@@ -304,7 +304,7 @@ def Venus_overall_sulfatereduction():
         # the current environment.
         SR.respiration.net_pathway.update_molar_gibbs_from_quotient()
 
-        midG.append(SR.respiration.net_pathway.molar_gibbs)
+        midG[i] = SR.respiration.net_pathway.molar_gibbs
 
         #for maxG, maximise products, minimise reactants
         V.update_reagent('H2(aq)', 15)
@@ -314,7 +314,7 @@ def Venus_overall_sulfatereduction():
         # the current environment.
         SR.respiration.net_pathway.update_molar_gibbs_from_quotient()
 
-        maxG.append(SR.respiration.net_pathway.molar_gibbs)
+        maxG[i] = SR.respiration.net_pathway.molar_gibbs
 
     return Tlst, minG, midG, maxG
 
@@ -327,15 +327,15 @@ def Venus_overall_h2oxidation():
     SR = es.base_organism('H2 oxidiser', V,
       setup_h2oxidation(V), workoutID=False)
 
-    # set up lists for plotting
-    minminG=[]
-    minG=[]
-    midG=[]
-    maxG=[]
-
     Tlst=np.linspace(278,350, num=100)
 
-    for T in Tlst:
+    # preallocate the output arrays rather than growing lists in the loop
+    minminG=np.empty(len(Tlst))
+    minG=np.empty(len(Tlst))
+    midG=np.empty(len(Tlst))
+    maxG=np.empty(len(Tlst))
+
+    for i, T in enumerate(Tlst):
          ### 25C
         V.env.T = T
         update_all_comp_ppm(V)
@@ -349,7 +349,7 @@ def Venus_overall_h2oxidation():
         # the current environment.
         SR.respiration.net_pathway.update_molar_gibbs_from_quotient()
 
-        minminG.append(SR.respiration.net_pathway.molar_gibbs)
+        minminG[i] = SR.respiration.net_pathway.molar_gibbs
 
         #for minG, maximise reactants, minimise products
         V.update_reagent('H2(aq)', 35)
@@ -360,7 +360,7 @@ def Venus_overall_h2oxidation():
         # the current environment.
         SR.respiration.net_pathway.update_molar_gibbs_from_quotient()
 
-        minG.append(SR.respiration.net_pathway.molar_gibbs)
+        minG[i] = SR.respiration.net_pathway.molar_gibbs
 
         #for midG, use recorded values
         V.update_reagent('H2(aq)', 25)
@@ -371,7 +371,7 @@ def Venus_overall_h2oxidation():
         # the current environment.
         SR.respiration.net_pathway.update_molar_gibbs_from_quotient()
 
-        midG.append(SR.respiration.net_pathway.molar_gibbs)
+        midG[i] = SR.respiration.net_pathway.molar_gibbs
 
         #for maxG, maximise products, minimise reactants
         V.update_reagent('H2(aq)', 15)
@@ -382,7 +382,7 @@ def Venus_overall_h2oxidation():
         # the current environment.
         SR.respiration.net_pathway.update_molar_gibbs_from_quotient()
 
-        maxG.append(SR.respiration.net_pathway.molar_gibbs)
+        maxG[i] = SR.respiration.net_pathway.molar_gibbs
 
     return Tlst, minG, midG, maxG, minminG
 